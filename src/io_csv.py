@@ -4,6 +4,9 @@
 import csv
 from pathlib import Path
 
+# Column order shared by loading and saving
+FIELDNAMES = ("name", "category", "price", "cooking_time", "ingredients", "steps")
+
 
 def load_recipes_into_user(user, csv_path: str) -> None:
     """
@@ -16,50 +19,73 @@ def load_recipes_into_user(user, csv_path: str) -> None:
     Raises:
         FileNotFoundError: If CSV file does not exist
     """
-    # Convert string path to Path object and check if file exists
+    # Import Recipe class here to avoid circular imports
+    from main import Recipe
+    
+    # Open CSV file (opening reports a missing file, no separate exists() check)
+    # newline='' hands raw line endings to the csv module, as its docs require
     file_path = Path(csv_path)
-    if not file_path.exists():
-        raise FileNotFoundError(f"CSV file not found: {csv_path}")
+    try:
+        file = file_path.open(mode='r', encoding='utf-8', newline='')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"CSV file not found: {csv_path}") from None
+    
+    # Stream rows -> Recipe objects -> user, one row in memory at a time
+    with file:
+        for fields in _iter_rows(csv.reader(file)):
+            user.add_recipe(Recipe(*fields), announce=False)
+
+
+def _iter_rows(csv_reader):
+    """
+    Yield the converted recipe fields of each CSV row
+    
+    Rows with invalid data are reported and skipped.
+    
+    Raises:
+        ValueError: If the header is missing a column
+    """
+    # Look up column positions once instead of building a dict per row
+    header = next(csv_reader, None)
+    if header is None:
+        return
+    columns = {column.strip(): position for position, column in enumerate(header)}
+    try:
+        (name_col, category_col, price_col,
+         time_col, ingredients_col, steps_col) = [columns[field] for field in FIELDNAMES]
+    except KeyError as e:
+        raise ValueError(f"CSV file is missing column {e}") from None
     
-    # Open and read CSV file
-    with file_path.open(mode='r', encoding='utf-8') as file:
-        csv_reader = csv.DictReader(file)
+    # Process each row (header already consumed above)
+    for row_number, row in enumerate(csv_reader, start=2):  # Start at 2 (row 1 is header)
+        if not row:
+            continue  # blank line
+        try:
+            # Extract and clean data from CSV row
+            name = row[name_col].strip()
+            category = row[category_col].strip()
+            
+            # Convert price (handle comma as decimal separator)
+            # float() and int() already ignore surrounding whitespace
+            price = float(row[price_col].replace(',', '.'))
+            
+            # Convert cooking time to integer
+            cooking_time = int(row[time_col])
+            
+            # Split ingredients by semicolon into list
+            ingredients_str = row[ingredients_col].strip()
+            ingredients = [item.strip() for item in ingredients_str.split(';')]
+            
+            # Split steps by semicolon into list
+            steps_str = row[steps_col].strip()
+            steps = [item.strip() for item in steps_str.split(';')]
+            
+        except (ValueError, IndexError) as e:
+            # Print warning and continue with next row
+            print(f"Warning: Invalid data in row {row_number}. Skipping. Error: {e}")
+            continue
         
-        # Process each row (skip header automatically with DictReader)
-        for row_number, row in enumerate(csv_reader, start=2):  # Start at 2 (row 1 is header)
-            try:
-                # Extract and clean data from CSV row
-                name = row['name'].strip()
-                category = row['category'].strip()
-                
-                # Convert price (handle comma as decimal separator)
-                price_str = row['price'].strip().replace(',', '.')
-                price = float(price_str)
-                
-                # Convert cooking time to integer
-                cooking_time = int(row['cooking_time'].strip())
-                
-                # Split ingredients by semicolon into list
-                ingredients_str = row['ingredients'].strip()
-                ingredients = [item.strip() for item in ingredients_str.split(';')]
-                
-                # Split steps by semicolon into list
-                steps_str = row['steps'].strip()
-                steps = [item.strip() for item in steps_str.split(';')]
-                
-                # Import Recipe class here to avoid circular imports
-                from main import Recipe
-                
-                # Create Recipe object
-                recipe = Recipe(name, category, price, cooking_time, ingredients, steps)
-                
-                # Add recipe to user
-                user.add_recipe(recipe)
-                
-            except (ValueError, KeyError) as e:
-                # Print warning and continue with next row
-                print(f"Warning: Invalid data in row {row_number}. Skipping. Error: {e}")
-                continue
+        yield name, category, price, cooking_time, ingredients, steps
 
 def save_user_recipes_to_csv(user, csv_path: str) -> None:
     """
@@ -70,17 +96,19 @@ def save_user_recipes_to_csv(user, csv_path: str) -> None:
     """
     file_path = Path(csv_path)
 
-    with file_path.open(mode="w", encoding="utf-8", newline="") as file:
-        fieldnames = ["name", "category", "price", "cooking_time", "ingredients", "steps"]
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
+    with file_path.open(mode="w", encoding="utf-8", newline="", buffering=1 << 20) as file:
+        writer = csv.writer(file)
+        writer.writerow(FIELDNAMES)
 
-        for recipe in user.recipes:
-            writer.writerow({
-                "name": recipe.name,
-                "category": recipe.category,
-                "price": recipe.price,
-                "cooking_time": recipe.cooking_time,
-                "ingredients": ";".join(recipe.ingredients),
-                "steps": ";".join(recipe.steps),
-            })
+        # Positional rows, written in one call (no per-row dict)
+        writer.writerows(
+            (
+                recipe.name,
+                recipe.category,
+                recipe.price,
+                recipe.cooking_time,
+                ";".join(recipe.ingredients),
+                ";".join(recipe.steps),
+            )
+            for recipe in user.recipes
+        )
@@ -1,6 +1,9 @@
  # RECIPE SELECTION SYSTEM  
 #==================================================================
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+import operator
 import time
 
 
@@ -8,6 +11,10 @@ import time
 class Recipe:
     """Stores information about a single recipe"""
     
+    # Fixed attributes: no per-instance __dict__, faster attribute reads
+    __slots__ = ('name', 'category', 'price', 'cooking_time', 'ingredients', 'steps',
+                 'rating', '_name_lc', '_ingredients_lc_joined')
+    
     def __init__(self, name, category, price, cooking_time, ingredients, steps, rating=0.0):
         self.name = name
         self.category = category  # soup, starter, main, dessert
@@ -16,6 +23,13 @@ class Recipe:
         self.ingredients = ingredients  # list of ingredients
         self.steps = steps  # cooking instructions
         self.rating = rating
+        self.update_search_keys()
+
+    def update_search_keys(self):
+        """Precompute lowercase name and ingredients used by the searches"""
+        self._name_lc = self.name.lower()
+        # One string per recipe so an ingredient search is a single substring test
+        self._ingredients_lc_joined = "\n".join(i.lower() for i in self.ingredients)
 
     
     def display(self):
@@ -36,6 +50,30 @@ class Recipe:
         print(f"{'='*50}\n")
 
 #=====================================================================================================
+                        # BUILT-IN SORT HELPER 
+@lru_cache(maxsize=None)
+def _key_getter(key):
+    """Return the attribute getter for a sort key, built once per key
+
+    operator.attrgetter is already a per-key getter implemented in C,
+    so sort keys are not specialised further by generating code at runtime.
+    """
+    return operator.attrgetter(key)
+
+
+def _sort_by_key(recipes, key):
+    """Return a sorted copy using the built-in (C) Timsort.
+
+    list.sort(key=...) reads every key once into an internal array and
+    sorts that array, so no per-comparison attribute lookups happen.
+    Timsort also detects already-ordered runs, so re-sorting a sorted
+    list is a single O(n) pass without any separate pre-check.
+    """
+    result = recipes[:]
+    result.sort(key=_key_getter(key))
+    return result
+
+
                         # ABSTRACT SORTING CLASS 
 class SortingAlgorithm(ABC):
     """Abstract base class for sorting algorithms"""
@@ -46,22 +84,43 @@ class SortingAlgorithm(ABC):
         pass
 
 
+                        #   BUILT-IN SORTING  
+class BuiltinSorting(SortingAlgorithm):
+    """Sorts recipes using Python's built-in Timsort (the default)"""
+    
+    name = "Built-in (Timsort)"
+    
+    def sort(self, recipes, key):
+        """Timsort via list.sort"""
+        return _sort_by_key(recipes, key)
+
+
                         #   LOOP-BASED SORTING  
 class LoopSorting(SortingAlgorithm):
     """Sorts recipes using loop-based bubble sort"""
     
+    name = "Loop (Bubble Sort)"
+    
     def sort(self, recipes, key):
         """Bubble sort using loops"""
         n = len(recipes)
         result = recipes.copy()  
+        # Read each key once; keys are swapped together with the recipes
+        keys = list(map(_key_getter(key), result))
         
         # Bubble sort algorithm using loops
         for i in range(n):
+            swapped = False
             for j in range(0, n - i - 1):
                 # Compare adjacent elements
-                if getattr(result[j], key) > getattr(result[j + 1], key):
+                if keys[j] > keys[j + 1]:
                     # Swap if in wrong order
                     result[j], result[j + 1] = result[j + 1], result[j]
+                    keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                    swapped = True
+            # A pass without swaps means the list is sorted
+            if not swapped:
+                break
         
         return result
 
@@ -70,55 +129,122 @@ class LoopSorting(SortingAlgorithm):
 class RecursionSorting(SortingAlgorithm):
     """Sorts recipes using recursion-based merge sort"""
     
+    name = "Recursion (Merge Sort)"
+    
     def sort(self, recipes, key):
         """Merge sort using recursion"""
+        # Read each key once; the recursion carries keys alongside recipes
+        keys = list(map(_key_getter(key), recipes))
+        return self._merge_sort(recipes, keys)[0]
+    
+    def _merge_sort(self, recipes, keys):
+        """Recursive merge sort over recipes and their parallel key list"""
         if len(recipes) <= 1:
-            return recipes
+            return recipes, keys
         
         # Divide: split list in half
         mid = len(recipes) // 2
-        left = self.sort(recipes[:mid], key)
-        right = self.sort(recipes[mid:], key)
+        left, left_keys = self._merge_sort(recipes[:mid], keys[:mid])
+        right, right_keys = self._merge_sort(recipes[mid:], keys[mid:])
         
         # Conquer: merge sorted halves
-        return self._merge(left, right, key)
+        return self._merge(left, left_keys, right, right_keys)
     
-    def _merge(self, left, right, key):
+    def _merge(self, left, left_keys, right, right_keys):
         """Helper method to merge two sorted lists"""
         result = []
+        result_keys = []
         i = j = 0
+        n_left, n_right = len(left), len(right)
         
-        while i < len(left) and j < len(right):
-            if getattr(left[i], key) <= getattr(right[j], key):
+        # Compare plain key values, no attribute lookups in the loop
+        while i < n_left and j < n_right:
+            if left_keys[i] <= right_keys[j]:
                 result.append(left[i])
+                result_keys.append(left_keys[i])
                 i += 1
             else:
                 result.append(right[j])
+                result_keys.append(right_keys[j])
                 j += 1
         
         result.extend(left[i:])
         result.extend(right[j:])
-        return result
+        result_keys.extend(left_keys[i:])
+        result_keys.extend(right_keys[j:])
+        return result, result_keys
+
+#=====================================================================================================
+                #   INPUT HELPER  
+def read_until_done(prompt="- ", numbered=False):
+    """Read non-empty lines until the user types 'done'
+
+    With numbered=True each prompt shows the number of the next entry.
+    """
+    lines = []
+    while True:
+        line = input(f"{len(lines)+1}. " if numbered else prompt)
+        if line.lower() == 'done':
+            break
+        if line:
+            lines.append(line)
+    return lines
 
 #=====================================================================================================
                 #   USER CLASS  
 class User:
     """Manages the collection of recipes"""
     
+    SEARCH_CACHE_SIZE = 128  # most recent searches kept, oldest evicted first
+    
     def __init__(self):
         self.recipes = []  # list to store all recipes
-        self.loop_sorter = LoopSorting()  # Loop-based sorting
-        self.recursion_sorter = RecursionSorting()  # Recursion-based sorting
+        self.builtin_sorter = BuiltinSorting()  # Built-in Timsort (default)
+        self.loop_sorter = LoopSorting()  # Loop-based bubble sort
+        self.recursion_sorter = RecursionSorting()  # Recursion-based merge sort
+        self._search_cache = OrderedDict()  # (search, terms) -> recipe indices, cleared on any change
+        self._ingredient_index = {}  # ingredient word -> set of recipe indices
+        self._index_dirty = False  # set when recipes are added, moved or changed; rebuilt on next search
+    
+    def _cached_search(self, key, search):
+        """Return cached recipe indices for key, running search() on a miss"""
+        indices = self._search_cache.get(key)
+        if indices is None:
+            indices = self._search_cache[key] = search()
+            if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        else:
+            self._search_cache.move_to_end(key)
+        return indices
     
-    def add_recipe(self, recipe):
-        """Add a new recipe to the collection"""
+    def _index_ingredients(self, index, recipe):
+        """Add a recipe's lowercase ingredient words to the ingredient index"""
+        for token in recipe._ingredients_lc_joined.split():
+            self._ingredient_index.setdefault(token, set()).add(index)
+    
+    def _get_ingredient_index(self):
+        """Return the ingredient index, rebuilding it if recipes moved or changed"""
+        if self._index_dirty:
+            self._ingredient_index = {}
+            for index, recipe in enumerate(self.recipes):
+                self._index_ingredients(index, recipe)
+            self._index_dirty = False
+        return self._ingredient_index
+    
+    def add_recipe(self, recipe, announce=True):
+        """Add a new recipe to the collection (announce=False for bulk loads)"""
         self.recipes.append(recipe)
-        print(f"✓ Recipe '{recipe.name}' added successfully!")
+        self._index_dirty = True
+        self._search_cache.clear()
+        if announce:
+            print(f"✓ Recipe '{recipe.name}' added successfully!")
     
     def delete_recipe(self, index):
         """Delete a recipe by index"""
         if 0 <= index < len(self.recipes):
             removed = self.recipes.pop(index)
+            self._index_dirty = True
+            self._search_cache.clear()
             print(f"✓ Recipe '{removed.name}' deleted successfully!")
             return True
         else:
@@ -162,13 +288,7 @@ class User:
             edit_ing = input("\nEdit ingredients? (y/n): ")
             if edit_ing.lower() == 'y':
                 print("Enter new ingredients (one per line, type 'done' when finished):")
-                new_ingredients = []
-                while True:
-                    ingredient = input("- ")
-                    if ingredient.lower() == 'done':
-                        break
-                    if ingredient:
-                        new_ingredients.append(ingredient)
+                new_ingredients = read_until_done()
                 if new_ingredients:
                     recipe.ingredients = new_ingredients
             
@@ -176,16 +296,13 @@ class User:
             edit_steps = input("Edit cooking steps? (y/n): ")
             if edit_steps.lower() == 'y':
                 print("Enter new steps (one per line, type 'done' when finished):")
-                new_steps = []
-                while True:
-                    step = input(f"{len(new_steps)+1}. ")
-                    if step.lower() == 'done':
-                        break
-                    if step:
-                        new_steps.append(step)
+                new_steps = read_until_done(numbered=True)
                 if new_steps:
                     recipe.steps = new_steps
             
+            recipe.update_search_keys()
+            self._index_dirty = True
+            self._search_cache.clear()
             print("✓ Recipe updated successfully!")
             return True
         else:
@@ -220,55 +337,66 @@ class User:
             print(f"- {recipe.name} (${recipe.price:.2f}, {recipe.cooking_time} min)")
         print(f"{'='*50}\n")
     
-    def sort_recipes(self, sort_by, use_recursion=False, use_logical_filter=False):
-        """Sort recipes using either loop or recursion algorithm"""
+    def sort_recipes(self, sort_by, method="builtin", use_logical_filter=False):
+        """Sort recipes with method "builtin" (Timsort), "bubble" (loop) or "merge" (recursion)"""
         if not self.recipes:
             print("\n⚠️  No recipes to sort!")
             return
         
-        recipes_to_sort = self.recipes
+        # Choose sorting algorithm
+        sorters = {
+            "builtin": self.builtin_sorter,
+            "bubble": self.loop_sorter,
+            "merge": self.recursion_sorter,
+        }
+        if method not in sorters:
+            print(f"\n❌ Unknown sorting method '{method}'!")
+            return
+        sorter = sorters[method]
+        method_name = sorter.name
         
         # Apply logical filter if requested (secondary sorting key)
         if use_logical_filter:
             # Logical expression: "cheap AND quick" (price <= 10 AND cooking_time <= 30)
-            filtered = [r for r in self.recipes if r.price <= 10 and r.cooking_time <= 30]
-            not_filtered = [r for r in self.recipes if not (r.price <= 10 and r.cooking_time <= 30)]
+            # Partition in a single pass so the condition is evaluated once per recipe
+            filtered = []
+            not_filtered = []
+            for r in self.recipes:
+                if r.price <= 10 and r.cooking_time <= 30:
+                    filtered.append(r)
+                else:
+                    not_filtered.append(r)
             
-            # Choose sorting algorithm
-            if use_recursion:
-                sorted_filtered = self.recursion_sorter.sort(filtered, sort_by)
-                sorted_not_filtered = self.recursion_sorter.sort(not_filtered, sort_by)
-                method = "Recursion (Merge Sort)"
-            else:
-                sorted_filtered = self.loop_sorter.sort(filtered, sort_by)
-                sorted_not_filtered = self.loop_sorter.sort(not_filtered, sort_by)
-                method = "Loop (Bubble Sort)"
+            sorted_filtered = sorter.sort(filtered, sort_by)
+            sorted_not_filtered = sorter.sort(not_filtered, sort_by)
             
             # Combine: logical TRUE recipes first, then FALSE
+            # (partition + two key sorts beats one sort on (not match, key)
+            # tuples, whose comparisons are much slower than plain numbers)
             sorted_recipes = sorted_filtered + sorted_not_filtered
             
             print(f"\n{'='*50}")
             print(f"SORTED BY {sort_by.upper()} WITH LOGICAL FILTER")
-            print(f"Using {method}")
+            print(f"Using {method_name}")
             print(f"Filter: Cheap (≤$10) AND Quick (≤30 min) recipes first")
             print(f"{'='*50}")
             
             if sorted_filtered:
                 print("\n✓ MATCHES FILTER (Cheap AND Quick):")
-                for i, recipe in enumerate(sorted_recipes, 1):
+                for i, recipe in enumerate(sorted_filtered, 1):
                     value = getattr(recipe, sort_by)
 
-                if sort_by == "price":
-                    print(f"{i}. {recipe.name} - ${value:.2f}")
+                    if sort_by == "price":
+                        print(f"{i}. {recipe.name} - ${value:.2f}")
 
-                elif sort_by == "cooking_time":
-                    print(f"{i}. {recipe.name} - {value} min")
+                    elif sort_by == "cooking_time":
+                        print(f"{i}. {recipe.name} - {value} min")
 
-                elif sort_by == "rating":
-                    print(f"{i}. {recipe.name} - ⭐ {value:.1f}/5")
+                    elif sort_by == "rating":
+                        print(f"{i}. {recipe.name} - ⭐ {value:.1f}/5")
 
-                else:
-                    print(f"{i}. {recipe.name} - {value}")
+                    else:
+                        print(f"{i}. {recipe.name} - {value}")
 
             
             if sorted_not_filtered:
@@ -284,15 +412,10 @@ class User:
         
         else:
             # Regular sorting without logical filter
-            if use_recursion:
-                sorted_recipes = self.recursion_sorter.sort(self.recipes, sort_by)
-                method = "Recursion (Merge Sort)"
-            else:
-                sorted_recipes = self.loop_sorter.sort(self.recipes, sort_by)
-                method = "Loop (Bubble Sort)"
+            sorted_recipes = sorter.sort(self.recipes, sort_by)
             
             print(f"\n{'='*50}")
-            print(f"SORTED BY {sort_by.upper()} - Using {method}")
+            print(f"SORTED BY {sort_by.upper()} - Using {method_name}")
             print(f"{'='*50}")
             for i, recipe in enumerate(sorted_recipes, 1):
                 value = getattr(recipe, sort_by)
@@ -304,6 +427,8 @@ class User:
         
         # Update internal list with sorted result
         self.recipes = sorted_recipes
+        self._index_dirty = True
+        self._search_cache.clear()
 
 #=====================================================================================================
             #   ADD NEW RECIPE 
@@ -324,45 +449,46 @@ def add_new_recipe_interactive(user):
         return
     
     print("\nEnter ingredients (one per line, type 'done' when finished):")
-    ingredients = []
-    while True:
-        ingredient = input("- ")
-        if ingredient.lower() == 'done':
-            break
-        if ingredient:
-            ingredients.append(ingredient)
+    ingredients = read_until_done()
     
     print("\nEnter cooking steps (one per line, type 'done' when finished):")
-    steps = []
-    while True:
-        step = input(f"{len(steps)+1}. ")
-        if step.lower() == 'done':
-            break
-        if step:
-            steps.append(step)
+    steps = read_until_done(numbered=True)
     
     new_recipe = Recipe(name, category, price, cooking_time, ingredients, steps)
     user.add_recipe(new_recipe)
 #================================================================================================
             # Performance function
 def performance_test(user, sort_key="cooking_time", runs=500):
-    """Simple timing comparison: Bubble Sort (loop) vs Merge Sort (recursion)."""
+    """Simple timing comparison: Bubble Sort (loop) vs Merge Sort (recursion) vs built-in Timsort."""
 
     if len(user.recipes) < 2:
         print("⚠️ Not enough recipes to run performance test.")
         return
 
+    # Sorters return new lists and never modify their input, so no per-run copy
+    recipes = user.recipes
+
+    # Monotonic nanosecond clock; sort methods bound to locals outside the loops
     # Bubble sort timing
-    start = time.time()
+    sort = user.loop_sorter.sort
+    start = time.perf_counter_ns()
     for _ in range(runs):
-        _ = user.loop_sorter.sort(user.recipes.copy(), sort_key)
-    bubble_time = time.time() - start
+        _ = sort(recipes, sort_key)
+    bubble_time = (time.perf_counter_ns() - start) / 1e9
 
     # Merge sort timing
-    start = time.time()
+    sort = user.recursion_sorter.sort
+    start = time.perf_counter_ns()
+    for _ in range(runs):
+        _ = sort(recipes, sort_key)
+    merge_time = (time.perf_counter_ns() - start) / 1e9
+
+    # Built-in Timsort timing
+    sort = user.builtin_sorter.sort
+    start = time.perf_counter_ns()
     for _ in range(runs):
-        _ = user.recursion_sorter.sort(user.recipes.copy(), sort_key)
-    merge_time = time.time() - start
+        _ = sort(recipes, sort_key)
+    builtin_time = (time.perf_counter_ns() - start) / 1e9
 
     print("\n" + "=" * 50)
     print("PERFORMANCE TEST")
@@ -370,9 +496,11 @@ def performance_test(user, sort_key="cooking_time", runs=500):
     print(f"Runs: {runs}, Sort key: {sort_key}")
     print(f"Loop-based Bubble Sort:     {bubble_time:.6f} seconds")
     print(f"Recursion-based Merge Sort: {merge_time:.6f} seconds")
+    print(f"Built-in Timsort:           {builtin_time:.6f} seconds")
     print("\nBig-O (theory):")
     print("- Bubble Sort: O(n^2)")
     print("- Merge Sort:  O(n log n)")
+    print("- Timsort:     O(n log n), O(n) on sorted input")
     print("=" * 50 + "\n")
 
 
@@ -400,24 +528,47 @@ def display_menu():
 
     print("="*50)
 
+# Search cores return recipe indices; results are cached in user._search_cache,
+# which User clears whenever the recipe list changes
+def _search_by_name_core(user, term):
+    return tuple(i for i, r in enumerate(user.recipes) if term in r._name_lc)
+
+def _search_by_ingredient_core(user, ingredient, exclude_term):
+    hits = _ingredient_hits(user, ingredient)
+    if exclude_term:
+        hits -= _ingredient_hits(user, exclude_term)
+    return tuple(sorted(hits))
+
+def _ingredient_hits(user, term):
+    """Indices of recipes with an ingredient containing term"""
+    if term.split() == [term]:
+        # A term without whitespace can only occur inside a single ingredient
+        # word, so scanning the index words is enough
+        hits = set()
+        for token, indices in user._get_ingredient_index().items():
+            if term in token:
+                hits |= indices
+        return hits
+    # A recipe without ingredients matches nothing, not even an empty term
+    return {i for i, r in enumerate(user.recipes)
+            if r.ingredients and term in r._ingredients_lc_joined}
+
 def search_by_name(user, term: str):
     term = term.strip().lower()
-    results = [r for r in user.recipes if term in r.name.lower()]
+    indices = user._cached_search(("name", term), lambda: _search_by_name_core(user, term))
+    results = [user.recipes[i] for i in indices]
     return results
 
 def search_by_ingredient(user, ingredient: str, exclude: str = None):
     ingredient = ingredient.strip().lower()
-    exclude_term = exclude.strip().lower() if exclude else None
-
-    results = []
-    for r in user.recipes:
-        ing_list = [i.lower() for i in r.ingredients]
-        has_include = any(ingredient in i for i in ing_list)
-        has_exclude = any(exclude_term in i for i in ing_list) if exclude_term else False
-
-        if has_include and not has_exclude:
-            results.append(r)
-
+    # None, '' and whitespace all mean "no exclusion" and share one cache entry
+    exclude_term = (exclude or "").strip().lower() or None
+
+    indices = user._cached_search(
+        ("ingredient", ingredient, exclude_term),
+        lambda: _search_by_ingredient_core(user, ingredient, exclude_term),
+    )
+    results = [user.recipes[i] for i in indices]
     return results
 
 
@@ -559,28 +710,30 @@ def main():
             filter_choice = input("Enter choice (1-2): ").strip()
 
             print("\nSorting method:")
-            print("1. Loop-based (Bubble Sort)")
-            print("2. Recursion-based (Merge Sort)")
-            method_choice = input("Enter choice (1-2): ").strip()
+            print("1. Built-in (Timsort)")
+            print("2. Loop-based (Bubble Sort)")
+            print("3. Recursion-based (Merge Sort)")
+            method_choice = input("Enter choice (1-3): ").strip()
+            method = {"2": "bubble", "3": "merge"}.get(method_choice, "builtin")
 
             if sort_choice == "1":
                 user.sort_recipes(
-                        "price",
-                        use_recursion=(method_choice == "2"),
-                     use_logical_filter=(filter_choice == "1")
-                    )
+                    "price",
+                    method=method,
+                    use_logical_filter=(filter_choice == "1")
+                )
 
             elif sort_choice == "2":
                 user.sort_recipes(
                     "cooking_time",
-                    use_recursion=(method_choice == "2"),
+                    method=method,
                     use_logical_filter=(filter_choice == "1")
                 )
 
             elif sort_choice == "3":
                 user.sort_recipes(
                     "rating",
-                    use_recursion=(method_choice == "2"),
+                    method=method,
                     use_logical_filter=(filter_choice == "1")
                 )
 